@@ -2,8 +2,9 @@
 
 """Utilities to handle crash CSV field names and CSV row helpers."""
 
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, Tuple
 import csv
+import functools
 from pathlib import Path
 
 # Column names used in the NYC crashes dataset (commonly present)
@@ -40,12 +41,25 @@ FIELDS: List[str] = [
 ]
 
 
+@functools.lru_cache(maxsize=4)
+def _row_getter(fields: Tuple[str, ...]) -> Callable[[Callable], tuple]:
+    """Compile a function mapping a row's `.get` to a tuple of its values in `fields` order.
+
+    The keys are inlined as constants, so serializing a row is one call with no loop; the
+    result is cached per field tuple, so extending `FIELDS` at runtime still works.
+    """
+    body = ", ".join(f"get({name!r}, '')" for name in fields)
+    namespace: Dict[str, object] = {}
+    exec(f"def _row(get):\n    return ({body},)\n", namespace)
+    return namespace["_row"]  # type: ignore[return-value]
+
+
 def dict_to_csv_row(row: Dict[str, object]) -> List[object]:
     """Return a list of values in `FIELDS` order from a mapping `row`.
 
     Missing keys are returned as empty strings to ensure a stable CSV order.
     """
-    return [row.get(k, "") for k in FIELDS]
+    return list(_row_getter(tuple(FIELDS))(row.get))
 
 
 def write_csv_header(path: str | Path):
@@ -57,15 +71,45 @@ def write_csv_header(path: str | Path):
 
 
 def append_rows_to_csv(path: str | Path, rows: Iterable[Dict[str, object]]):
-    """Append multiple dict rows to a CSV file (writing header if missing)."""
+    """Append multiple dict rows to a CSV file (writing header if missing).
+
+    Rows are streamed through a single `writerows` call into a 1 MiB write buffer. A pandas
+    DataFrame is appended with `to_csv` instead, so no per-row dicts are built.
+    """
     p = Path(path)
     write_header = not p.exists()
-    with p.open("a", encoding="utf-8", newline="") as fh:
+    if hasattr(rows, "to_csv"):
+        write_frame_to_csv(p, rows, append=True, header=write_header)
+        return
+    fields = tuple(FIELDS)
+    to_row = _row_getter(fields)
+    with p.open("a", encoding="utf-8", newline="", buffering=1 << 20) as fh:
         w = csv.writer(fh)
         if write_header:
-            w.writerow(FIELDS)
-        for r in rows:
-            w.writerow(dict_to_csv_row(r))
+            w.writerow(fields)
+        w.writerows(to_row(r.get) for r in rows)
+
+
+def write_frame_to_csv(path: str | Path, df, append: bool = False, header: bool = True) -> None:
+    """Write a pandas DataFrame to `path` in `FIELDS` order (replacing the file unless `append`).
+
+    Uses `DataFrame.to_csv` so the body is serialized in one C-level pass; columns the
+    frame lacks are written empty, matching `dict_to_csv_row`.
+    """
+    if all(name in df.columns for name in FIELDS):
+        out = df
+    else:
+        out = df.reindex(columns=FIELDS)
+    out.to_csv(path, mode="a" if append else "w", header=header, index=False, columns=FIELDS, encoding="utf-8", lineterminator="\r\n")
+
+
+def write_rows_to_csv(path: str | Path, data) -> None:
+    """Write `data` (DataFrame or iterable of dict rows) to `path` with a `FIELDS` header."""
+    if hasattr(data, "to_csv"):
+        write_frame_to_csv(path, data)
+    else:
+        write_csv_header(path)
+        append_rows_to_csv(path, data)
 
 
-__all__ = ["FIELDS", "dict_to_csv_row", "write_csv_header", "append_rows_to_csv"] 
\ No newline at end of file
+__all__ = ["FIELDS", "dict_to_csv_row", "write_csv_header", "append_rows_to_csv", "write_frame_to_csv", "write_rows_to_csv"] 
\ No newline at end of file
@@ -9,25 +9,335 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 from datetime import datetime
 import json
+import os
 import socket
+import sys
+import threading
+import time
 import ssl
 import urllib.request
 import urllib.error
 import io
 import urllib.parse
 
+try:
+	import orjson  # type: ignore
+except Exception:
+	orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def _pandas():
+	"""Return the pandas module, or None when it cannot be imported; resolved once per process."""
+	try:
+		import pandas  # type: ignore
+
+		return pandas
+	except Exception:
+		return None
+
 
 def _pandas_available() -> bool:
+	return _pandas() is not None
+
+
+def _read_csv_frame(pd, source, **kwargs):
+	"""Parse `source` into a DataFrame, preferring pandas' multithreaded pyarrow engine for local files.
+
+	Falls back to the C engine when pyarrow is missing or rejects the file.
+	Row-limited reads (`nrows=`) and URLs go straight to the C engine, which stops early.
+	Local files are memory-mapped for the C engine (pyarrow does not accept `memory_map`),
+	which also builds `CATEGORY_COLUMNS` as categoricals while parsing instead of
+	materializing them as strings first.
+	"""
+	c_kwargs = dict(kwargs, engine="c", low_memory=False)
+	c_kwargs.setdefault("dtype", dict.fromkeys(CATEGORY_COLUMNS, "category"))
+	if isinstance(source, Path):
+		c_kwargs["memory_map"] = True
+	# URL reads are network-bound, so pyarrow's parallel parse buys nothing there
+	if kwargs.get("nrows") is not None or not isinstance(source, Path):
+		return pd.read_csv(source, **c_kwargs)
 	try:
-		import pandas as _pd  # type: ignore
+		df = pd.read_csv(source, engine="pyarrow", **kwargs)
+	except Exception:
+		return pd.read_csv(source, **c_kwargs)
+	if "crash_date" in df.columns and not pd.api.types.is_string_dtype(df["crash_date"]):
+		# pyarrow infers ISO dates ("2023-09-08T00:00:00.000") as timestamps; keep the source
+		# text like the C engine does so browse pages and exports show it unchanged
+		df["crash_date"] = _read_text_column(source, "crash_date")
+	return df
+
+
+def _read_text_column(source: Path, column: str):
+	"""Re-read one column of a local CSV as strings (empty cells as missing) with pyarrow."""
+	import pyarrow as pa  # type: ignore
+	import pyarrow.csv as pa_csv  # type: ignore
+
+	options = pa_csv.ConvertOptions(include_columns=[column], column_types={column: pa.string()}, strings_can_be_null=True)
+	return pa_csv.read_csv(source, convert_options=options).column(column).to_pandas()
+
+
+# Columns needed by `summarize` and `compute_stats`; pass as `columns=` to skip parsing the rest
+DEFAULT_COLUMNS = (
+	"crash_date",
+	"crash_time",
+	"borough",
+	"on_street_name",
+	"number_of_persons_injured",
+	"number_of_persons_killed",
+	"contributing_factor_vehicle_1",
+	"vehicle_type_code1",
+	"vehicle_type_code2",
+	"vehicle_type_code3",
+	"vehicle_type_code4",
+	"vehicle_type_code5",
+)
+
+
+# Repetitive text columns stored as pandas categoricals so value_counts/equality run on int codes
+CATEGORY_COLUMNS = (
+	"on_street_name",
+	"contributing_factor_vehicle_1",
+	"contributing_factor_vehicle_2",
+	"contributing_factor_vehicle_3",
+	"contributing_factor_vehicle_4",
+	"contributing_factor_vehicle_5",
+	"borough",
+	"vehicle_type_code1",
+	"vehicle_type_code2",
+	"vehicle_type_code3",
+	"vehicle_type_code4",
+	"vehicle_type_code5",
+)
+
+
+def _finalize_frame(pd, df):
+	"""Add `crash_datetime` and cast `CATEGORY_COLUMNS` to `category` on a freshly read frame.
+
+	Each derived column depends only on its source column, so they are converted on a
+	thread pool; pandas' datetime parsing and factorize kernels release the GIL.
+	"""
+	tasks = {}
+	if "crash_date" in df.columns:
+		tasks["crash_datetime"] = lambda: _combine_crash_datetime(pd, df)
+	for col in CATEGORY_COLUMNS:
+		if col not in df.columns:
+			continue
+		if isinstance(df[col].dtype, pd.CategoricalDtype):
+			# the C engine turns an all-empty column into a category-less categorical; store it
+			# as float NaN like the pyarrow engine does so both engines yield the same schema
+			if not len(df[col].cat.categories):
+				df[col] = df[col].astype("float64")
+		# all-empty columns come back as float NaN; categorizing those buys nothing
+		elif not pd.api.types.is_numeric_dtype(df[col]):
+			tasks[col] = lambda series=df[col]: series.astype("category")
+	if len(tasks) > 1:
+		with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+			futures = {name: pool.submit(task) for name, task in tasks.items()}
+			results = {name: future.result() for name, future in futures.items()}
+	else:
+		results = {name: task() for name, task in tasks.items()}
+	for name, values in results.items():
+		df[name] = values
+	return df
+
+
+def _top_counts(series, n: int) -> dict:
+	"""Return the `n` most frequent values of `series`, skipping unobserved categories."""
+	counts = series.value_counts(dropna=True).head(n)
+	return counts[counts > 0].to_dict()
 
-		return True
+
+# Bump whenever `_finalize_frame` or the read path changes what a loaded frame holds; sidecars
+# written under an older version are ignored and deleted on the next write
+_SIDECAR_VERSION = 2
+
+
+def _parquet_sidecar(path_obj: Path) -> Path:
+	"""Location of the Parquet copy cached next to a CSV file (tagged with `_SIDECAR_VERSION`)."""
+	return path_obj.with_suffix(f".v{_SIDECAR_VERSION}.parquet")
+
+
+def _stale_sidecars(path_obj: Path) -> list:
+	"""Sidecars of `path_obj` written by older `_SIDECAR_VERSION`s; other Parquet files are never touched."""
+	candidates = (path_obj.with_suffix(f".v{version}.parquet") for version in range(1, _SIDECAR_VERSION))
+	return [p for p in candidates if p.exists()]
+
+
+def _read_parquet_sidecar(pd, path_obj: Path, columns: Optional[Sequence[str]] = None):
+	"""Return the cached DataFrame for `path_obj` when a current-version sidecar newer than the CSV exists, else None.
+
+	The file is memory-mapped, and with `columns` only those (plus the derived
+	`crash_datetime` when `crash_date` is requested) are loaded.
+	"""
+	sidecar = _parquet_sidecar(path_obj)
+	try:
+		if sidecar.stat().st_mtime < path_obj.stat().st_mtime:
+			return None
+		if columns is not None:
+			import pyarrow.parquet as pq  # type: ignore
+
+			wanted = set(columns)
+			if "crash_date" in wanted:
+				wanted.add("crash_datetime")
+			columns = [name for name in pq.read_schema(sidecar).names if name in wanted]
+		df = pd.read_parquet(sidecar, engine="pyarrow", columns=columns, memory_map=True)
+	except Exception:
+		# missing sidecar, pyarrow not installed, or an unreadable file: parse the CSV instead
+		return None
+	return df
+
+
+@functools.lru_cache(maxsize=1)
+def _pyarrow_available() -> bool:
+	try:
+		import pyarrow.parquet  # type: ignore  # noqa: F401
 	except Exception:
 		return False
+	return True
+
+
+# Sidecars whose write failed this process (read-only mount, disk full, ...); not retried
+_unwritable_sidecars: set = set()
+
+
+def _sidecar_writable(path_obj: Path) -> bool:
+	"""Whether a full read of `path_obj` can be cached as a sidecar (pyarrow present, directory writable)."""
+	return (
+		_pyarrow_available()
+		and _parquet_sidecar(path_obj) not in _unwritable_sidecars
+		and os.access(path_obj.parent, os.W_OK)
+	)
+
+
+def _write_parquet_sidecar(df, path_obj: Path) -> None:
+	"""Best-effort write of `df` (with `crash_datetime` and categoricals) next to the CSV."""
+	sidecar = _parquet_sidecar(path_obj)
+	for stale in _stale_sidecars(path_obj):
+		try:
+			stale.unlink()
+		except OSError:
+			pass
+	try:
+		df.to_parquet(sidecar, engine="pyarrow", compression="zstd")
+	except Exception:
+		# caching is an optimisation only; never leave a half-written file behind, and let
+		# later `columns=` reads of this file parse only what they need
+		_unwritable_sidecars.add(sidecar)
+		try:
+			sidecar.unlink()
+		except OSError:
+			pass
+
+
+# Known `crash_date crash_time` layouts: the Socrata API serves ISO dates, the portal export US dates
+_CRASH_DATETIME_FORMATS = ("%Y-%m-%d %H:%M", "%m/%d/%Y %H:%M")
+
+
+def _combine_crash_datetime(pd, df):
+	"""Return a datetime Series built from `crash_date` (and `crash_time` when present).
+
+	Each known layout is parsed with an explicit `format=` so pandas never falls back to
+	per-element dateutil inference; only rows matching none of them are inferred.
+	"""
+	dates = df["crash_date"]
+	has_time = "crash_time" in df.columns
+	if pd.api.types.is_datetime64_any_dtype(dates):
+		# the pyarrow engine already parsed the date; only the time of day is left to add
+		if not has_time:
+			return dates
+		return dates + pd.to_timedelta(df["crash_time"].fillna("00:00").astype(str) + ":00", errors="coerce")
+	raw = dates.astype(str)
+	# "2021-09-11T00:00:00.000" and "09/11/2021" both carry the date in the first 10 characters
+	text = raw.str.slice(0, 10)
+	if has_time:
+		# a missing time means midnight rather than an unparsable "date nan"
+		times = df["crash_time"].fillna("00:00").astype(str)
+		text = text.str.cat(times, sep=" ")
+		raw = raw.str.cat(times, sep=" ")
+		formats = _CRASH_DATETIME_FORMATS
+	else:
+		formats = tuple(fmt.split(" ")[0] for fmt in _CRASH_DATETIME_FORMATS)
+	result = pd.to_datetime(text, format=formats[0], errors="coerce", cache=True)
+	for fmt in formats[1:]:
+		missing = result.isna()
+		if not missing.any():
+			return result
+		result = result.fillna(pd.to_datetime(text[missing], format=fmt, errors="coerce", cache=True))
+	missing = result.isna()
+	if missing.any():
+		# anything left is in an unknown layout; let pandas infer it from the unsliced text
+		result = result.fillna(pd.to_datetime(raw[missing], errors="coerce"))
+	return result
+
+
+# Low-cardinality text columns whose values the csv fallback interns (one shared str per value)
+_INTERNED_COLUMNS = frozenset(
+	("borough", "on_street_name")
+	+ tuple(f"contributing_factor_vehicle_{i}" for i in range(1, 6))
+	+ tuple(f"vehicle_type_code{i}" for i in range(1, 6))
+)
+
+
+def _read_dict_rows(fh, max_rows: Optional[int] = None, columns: Optional[Sequence[str]] = None) -> list:
+	"""Read CSV rows from `fh` as dicts, adding a combined `crash_datetime` string in the same pass.
+
+	Uses `csv.reader` and zips each row against the header, avoiding `csv.DictReader`'s
+	per-row bookkeeping; the date/time fields are read by position. Values of
+	`_INTERNED_COLUMNS` are interned so repeated streets/factors share one object. Stops
+	after `max_rows` rows when given, and keeps only `columns` when given.
+	"""
+	reader = csv.reader(fh)
+	header = next(reader, None)
+	if not header:
+		return []
+	width = len(header)
+	keep = None
+	kept = header
+	if columns is not None:
+		wanted = set(columns)
+		keep = [(i, name) for i, name in enumerate(header) if name in wanted]
+		kept = [name for _, name in keep]
+	date_idx = header.index("crash_date") if "crash_date" in kept else None
+	time_idx = header.index("crash_time") if "crash_time" in kept else None
+	intern_idx = [i for i, name in enumerate(header) if name in _INTERNED_COLUMNS and name in kept]
+	intern = sys.intern
+	# crashes repeat date/time pairs, so each distinct joined string is built (and hashed) once
+	joined_cache: Dict[tuple, str] = {}
+	rows = []
+	append = rows.append
+	for values in reader:
+		if max_rows is not None and len(rows) >= max_rows:
+			break
+		if not values:
+			continue
+		if len(values) < width:
+			values += [None] * (width - len(values))
+		for i in intern_idx:
+			value = values[i]
+			if value:
+				values[i] = intern(value)
+		if keep is None:
+			row = dict(zip(header, values))
+		else:
+			row = {name: values[i] for i, name in keep}
+		if date_idx is not None:
+			date = values[date_idx] or ""
+			time = (values[time_idx] or "") if time_idx is not None else ""
+			key = (date, time)
+			joined = joined_cache.get(key)
+			if joined is None:
+				joined = joined_cache[key] = (date + " " + time).strip()
+			row["crash_datetime"] = joined
+		append(row)
+	return rows
 
 
 # NYC API Configuration
@@ -40,33 +350,133 @@ CACHE_FILE = CACHE_DIR / "nyc_crashes_cached.csv"
 CACHE_META_FILE = CACHE_DIR / "nyc_crashes_meta.json"
 
 
+# Connectivity answers are reused for this many seconds within a session
+_ONLINE_TTL = 30.0
+_online_checked: Optional[tuple] = None
+
+
 def _is_online() -> bool:
-	"""Check if internet connection is available."""
+	"""Check if internet connection is available (reusing a check younger than `_ONLINE_TTL`)."""
+	global _online_checked
+	now = time.monotonic()
+	if _online_checked is not None and now - _online_checked[0] < _ONLINE_TTL:
+		return _online_checked[1]
 	try:
-		socket.create_connection(("8.8.8.8", 53), timeout=3)
-		return True
-	except (socket.timeout, socket.error):
-		return False
+		# a reachable resolver answers a TCP connect well within a second
+		with socket.create_connection(("8.8.8.8", 53), timeout=1):
+			online = True
+	except OSError:
+		online = False
+	_online_checked = (now, online)
+	return online
 
 
-def _disable_ssl_verification():
-	"""Disable SSL verification for macOS certificate issues."""
-	try:
-		ssl._create_default_https_context = ssl._create_unverified_context
-	except Exception:
-		pass
+def _read_json(path: Path) -> Any:
+	"""Load a JSON file, with orjson when installed."""
+	if orjson is not None:
+		return orjson.loads(path.read_bytes())
+	with path.open("r") as f:
+		return json.load(f)
+
+
+def _write_json(path: Path, obj: Any) -> None:
+	"""Write `obj` as indented JSON, with orjson when installed."""
+	if orjson is not None:
+		path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+		return
+	with path.open("w") as f:
+		json.dump(obj, f, indent=2)
+
+
+def _probe_online_async() -> Future:
+	"""Run `_is_online` on a daemon thread and return a Future for its result.
+
+	A daemon thread (rather than an executor) lets the process exit without waiting
+	for a probe whose answer turned out not to be needed.
+	"""
+	future: Future = Future()
+
+	def run() -> None:
+		future.set_result(_is_online())
+
+	threading.Thread(target=run, name="nyc-online-probe", daemon=True).start()
+	return future
 
 
-def _download_nyc_crashes(url: str) -> str:
-	"""Download CSV data from NYC open data API, handling SSL issues."""
-	_disable_ssl_verification()
+_DOWNLOAD_HEADERS = {
+	# a browser-like User-Agent avoids HTTP 403 from some endpoints
+	"User-Agent": "Mozilla/5.0 (compatible; DataPull/1.0)",
+	"Accept-Encoding": "gzip, deflate",
+}
+_DOWNLOAD_CHUNK = 64 * 1024
+_http_session = None
+
+
+def _get_http_session():
+	"""Return a shared `requests.Session` (pooled keep-alive connections), or None without requests."""
+	global _http_session
+	if _http_session is None:
+		try:
+			import requests  # type: ignore
+			from requests.adapters import HTTPAdapter  # type: ignore
+			from urllib3.util.retry import Retry  # type: ignore
+		except Exception:
+			return None
+		session = requests.Session()
+		session.headers.update(_DOWNLOAD_HEADERS)
+		retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+		session.mount("https://", HTTPAdapter(max_retries=retry))
+		session.mount("http://", HTTPAdapter(max_retries=retry))
+		_http_session = session
+	return _http_session
+
+
+def _download_nyc_crashes(url: str, dest: Path, verify: bool = False) -> Path:
+	"""Stream CSV data from the NYC open data API into `dest`.
+
+	The response is requested gzip-compressed and written in 64 KiB chunks to a temporary
+	file that replaces `dest` only once complete. Uses a pooled `requests` session when
+	installed, else urllib. `verify=False` (the default) skips certificate checks for
+	machines with broken CA stores (e.g. python.org builds on macOS).
+	"""
+	tmp = dest.with_name(dest.name + ".part")
 	try:
-		# Use a browser-like User-Agent to avoid HTTP 403 from some endpoints
-		req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 (compatible; DataPull/1.0)"})
-		with urllib.request.urlopen(req, timeout=30) as resp:
-			text = resp.read().decode("utf-8-sig")
-		return text
-	except urllib.error.URLError as e:
+		session = _get_http_session()
+		if session is not None:
+			if not verify:
+				import urllib3  # type: ignore
+
+				urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+			with session.get(url, stream=True, timeout=30, verify=verify) as resp:
+				resp.raise_for_status()
+				with tmp.open("wb") as fh:
+					for chunk in resp.iter_content(_DOWNLOAD_CHUNK):
+						fh.write(chunk)
+		else:
+			import gzip
+			import shutil
+			import zlib
+
+			context = None if verify else ssl._create_unverified_context()
+			req = urllib.request.Request(url, headers=_DOWNLOAD_HEADERS)
+			with urllib.request.urlopen(req, timeout=30, context=context) as resp, tmp.open("wb") as fh:
+				encoding = (resp.headers.get("Content-Encoding") or "").lower()
+				if encoding == "gzip":
+					shutil.copyfileobj(gzip.GzipFile(fileobj=resp), fh, _DOWNLOAD_CHUNK)
+				elif encoding == "deflate":
+					inflate = zlib.decompressobj()
+					for chunk in iter(lambda: resp.read(_DOWNLOAD_CHUNK), b""):
+						fh.write(inflate.decompress(chunk))
+					fh.write(inflate.flush())
+				else:
+					shutil.copyfileobj(resp, fh, _DOWNLOAD_CHUNK)
+		tmp.replace(dest)
+		return dest
+	except Exception as e:
+		try:
+			tmp.unlink()
+		except OSError:
+			pass
 		raise Exception(f"Failed to download from {url}: {e}")
 
 
@@ -85,8 +495,12 @@ def pull_and_cache_nyc_crashes(force_update: bool = False, start_date: str | Non
 	Returns:
 		tuple of (data, metadata) where:
 		- data is the CSV content or parsed rows
-		- metadata includes cache_timestamp, source, last_updated_from_api, url, and year_filter
+		- metadata includes cache_timestamp, source, last_updated_from_api, url, year_filter and
+		  date_range ([start, end] ISO dates the cached CSV was fetched with, else None)
 	"""
+	# start the connectivity probe (at most a 1 s connect, reused for _ONLINE_TTL) while metadata
+	# and cache state are read
+	online_probe = _probe_online_async()
 	CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 	metadata = {
@@ -95,20 +509,39 @@ def pull_and_cache_nyc_crashes(force_update: bool = False, start_date: str | Non
 		"last_updated_from_api": None,
 		"url": NYC_CRASHES_URL,
 		"year_filter": year_filter if year_filter else None,
+		"date_range": None,
 	}
 
 	# Load existing metadata
 	if CACHE_META_FILE.exists():
 		try:
-			with CACHE_META_FILE.open("r") as f:
-				metadata.update(json.load(f))
+			metadata.update(_read_json(CACHE_META_FILE))
 		except Exception:
 			pass
 
-	is_online = _is_online()
 	cache_exists = CACHE_FILE.exists()
+	cache_age_days = None
+	if cache_exists:
+		try:
+			cache_age_seconds = time.time() - CACHE_FILE.stat().st_mtime
+			cache_age_days = cache_age_seconds / (60 * 60 * 24)
+		except Exception:
+			pass
 
-	print(f"[NYC Crashes Data] Online: {is_online}, Cache exists: {cache_exists}")
+	# The connectivity probe only matters when something could trigger a download
+	wants_update = (
+		force_update
+		or not cache_exists
+		or (cache_age_days is not None and cache_age_days > 7)
+		or bool(start_date or end_date)
+		or year_filter is not None
+	)
+	if wants_update:
+		is_online = online_probe.result()
+		print(f"[NYC Crashes Data] Online: {is_online}, Cache exists: {cache_exists}")
+	else:
+		is_online = False
+		print("[NYC Crashes Data] Cache is fresh, skipping online check")
 
 	# Determine if we should update from API
 	should_update = False
@@ -117,15 +550,9 @@ def pull_and_cache_nyc_crashes(force_update: bool = False, start_date: str | Non
 		print("Force update requested...")
 	elif is_online and cache_exists:
 		# Check cache age (update if > 7 days old)
-		try:
-			import time
-			cache_age_seconds = time.time() - CACHE_FILE.stat().st_mtime
-			cache_age_days = cache_age_seconds / (60 * 60 * 24)
-			if cache_age_days > 7:
-				should_update = True
-				print(f"Cache is {cache_age_days:.1f} days old, updating...")
-		except Exception:
-			pass
+		if cache_age_days is not None and cache_age_days > 7:
+			should_update = True
+			print(f"Cache is {cache_age_days:.1f} days old, updating...")
 	elif is_online and not cache_exists:
 		should_update = True
 		print("No cache found, downloading from API...")
@@ -166,17 +593,16 @@ def pull_and_cache_nyc_crashes(force_update: bool = False, start_date: str | Non
 				url = NYC_RESOURCE_CSV + "?" + urllib.parse.urlencode(params)
 
 			print(f"Downloading from {url}...")
-			csv_text = _download_nyc_crashes(url)
-			# Write the downloaded CSV to the cache file
-			with CACHE_FILE.open("w", encoding="utf-8") as f:
-				f.write(csv_text)
+			# Stream the downloaded CSV straight into the cache file
+			_download_nyc_crashes(url, CACHE_FILE)
 			metadata["cache_timestamp"] = datetime.now().isoformat()
 			metadata["source"] = "api"
 			metadata["last_updated_from_api"] = datetime.now().isoformat()
 			metadata["url"] = url
+			# the $where clause bounds the file to exactly this range, so callers can skip re-filtering
+			metadata["date_range"] = [start_date, end_date] if start_date and end_date else None
 			# Save metadata
-			with CACHE_META_FILE.open("w") as f:
-				json.dump(metadata, f, indent=2)
+			_write_json(CACHE_META_FILE, metadata)
 			print(f"✓ Cache updated: {CACHE_FILE}")
 			# Socrata limits responses to 50,000 rows by default; if the API returned the limit, warn the user
 			if "$limit" in url and "500000" not in url:
@@ -200,11 +626,20 @@ def pull_and_cache_nyc_crashes(force_update: bool = False, start_date: str | Non
 		)
 
 
-def read_accidents_csv(path: str, use_pandas: Optional[bool] = None, start_date: str | None = None, end_date: str | None = None, force_update: bool = False):
+def read_accidents_csv(path: str, use_pandas: Optional[bool] = None, start_date: str | None = None, end_date: str | None = None, force_update: bool = False, max_rows: Optional[int] = None, columns: Optional[Sequence[str]] = None):
 	"""Read accidents CSV and return a DataFrame when pandas is available.
 
 	If pandas is not installed or use_pandas=False, returns a list of dict rows.
 	It will attempt to combine `crash_date` and `crash_time` into `crash_datetime` when possible.
+	When `max_rows` is set only the first `max_rows` data rows are read (preview-only callers).
+	When `columns` is set (e.g. `DEFAULT_COLUMNS`) only those columns are returned; names missing
+	from the file are ignored.
+
+	Full pandas reads of a local file are cached in a `.parquet` file next to the CSV (when
+	pyarrow is installed and the directory is writable) and reused, also for `columns=` reads,
+	while it is newer than the CSV. To fill that cache, a `columns=` read with no current
+	sidecar parses every column once and projects afterwards; when no sidecar can be written
+	(and for `max_rows` previews, URLs and the csv fallback) only `columns` are parsed.
 	
 	Special paths:
 	  - "nyc" or "nyc:latest" — pulls from NYC API with automatic caching & updates
@@ -233,160 +668,108 @@ def read_accidents_csv(path: str, use_pandas: Optional[bool] = None, start_date:
 			pandas_ok = False
 		if pandas_ok:
 			# let pandas handle URL reads (handles compression and formats)
-			import pandas as pd  # type: ignore
-
-			df = pd.read_csv(path, low_memory=False)
-			# combine date/time when possible
-			if "crash_date" in df.columns:
-				time_col = "crash_time" if "crash_time" in df.columns else None
-				if time_col:
-					df["crash_datetime"] = pd.to_datetime(
-						df["crash_date"].astype(str).str.strip() + " " + df[time_col].astype(str).str.strip(),
-						errors="coerce",
-					)
-				else:
-					df["crash_datetime"] = pd.to_datetime(df["crash_date"], errors="coerce")
-			return df
-		# fall back to simple download and csv reader
-		import urllib.request
-		import io
+			pd = _pandas()
+			# the header is unknown before download, so filter with a callable (C engine)
+			usecols = None if columns is None else (lambda name, wanted=set(columns): name in wanted)
+			df = _read_csv_frame(pd, path, nrows=max_rows, usecols=usecols)
+			# combine date/time and cast categoricals
+			return _finalize_frame(pd, df)
+		# fall back to the csv reader, decoding the response as it streams in (BOM stripped
+		# by utf-8-sig) instead of holding the whole body as bytes and again as str
 		with urllib.request.urlopen(path) as resp:
-			text = resp.read().decode("utf-8-sig")
-		reader = csv.DictReader(io.StringIO(text))
-		rows = [row for row in reader]
-		# Try to add combined datetime string if fields exist
-		if rows and "crash_date" in rows[0]:
-			for r in rows:
-				date = r.get("crash_date") or ""
-				time = r.get("crash_time") or ""
-				r["crash_datetime"] = (date + " " + time).strip()
-		return rows
+			return _read_dict_rows(io.TextIOWrapper(resp, encoding="utf-8-sig", newline=""), max_rows, columns)
 
 	path_obj = Path(path)
 	if not path_obj.exists():
 		raise FileNotFoundError(f"File not found: {path}")
 
 	# Decide whether to use pandas; but if pandas is absent we gracefully fall back to csv
-	pandas_ok = _pandas_available()
-	will_use_pandas = False
-	if use_pandas is not False and pandas_ok:
-		# attempt to import pandas (guard against ImportError after detection)
-		try:
-			import pandas as pd  # type: ignore
-			will_use_pandas = True
-		except Exception:
-			# pandas detected earlier but import failed; fall back to csv reader
-			will_use_pandas = False
+	pd = _pandas() if use_pandas is not False else None
 
-	if not will_use_pandas:
+	if pd is None:
 		# Fallback to csv.DictReader
 		with path_obj.open("r", encoding="utf-8-sig", newline="") as fh:
-			reader = csv.DictReader(fh)
-			rows = [row for row in reader]
-		# Try to add combined datetime string if fields exist
-		if rows and "crash_date" in rows[0]:
-			for r in rows:
-				date = r.get("crash_date") or ""
-				time = r.get("crash_time") or ""
-				r["crash_datetime"] = (date + " " + time).strip()
-		return rows
-
-	# Prefer pandas (import succeeded above)
-	import pandas as pd  # type: ignore
-
-	# Try the default C engine first; if it fails due to irregular quoting or unexpected
+			return _read_dict_rows(fh, max_rows, columns)
+
+	# Prefer pandas (resolved above)
+	if max_rows is None:
+		cached = _read_parquet_sidecar(pd, path_obj, columns)
+		if cached is not None:
+			return cached
+	# a full read that will be cached parses every column once so the sidecar can serve later
+	# `columns=` reads too; without a sidecar only the requested columns are parsed
+	write_sidecar = max_rows is None and _sidecar_writable(path_obj)
+
+	# Try the pyarrow/C engines first; if they fail due to irregular quoting or unexpected
 	# field counts, retry with the python engine and skip bad lines. If that still fails,
 	# fall back to a simple csv.DictReader.
+	usecols = None
+	if columns is not None and not write_sidecar:
+		# resolve against the header so the pyarrow engine gets a plain list
+		with path_obj.open("r", encoding="utf-8-sig", newline="") as fh:
+			header = next(csv.reader(fh), [])
+		wanted = set(columns)
+		usecols = [name for name in header if name in wanted]
 	try:
-		df = pd.read_csv(path_obj, low_memory=False)
+		df = _read_csv_frame(pd, path_obj, nrows=max_rows, usecols=usecols)
 	except Exception as exc:
 		# try a more permissive parser
 		try:
-			df = pd.read_csv(path_obj, low_memory=False, engine="python", on_bad_lines="skip")
+			df = pd.read_csv(path_obj, engine="python", on_bad_lines="skip", nrows=max_rows, usecols=usecols)
 			print("Warning: Some CSV lines were malformed and were skipped during parsing.")
 		except Exception:
 			# Final fallback to csv reader
 			with path_obj.open("r", encoding="utf-8-sig", newline="") as fh:
-				reader = csv.DictReader(fh)
-				rows = [row for row in reader]
-				if rows and "crash_date" in rows[0]:
-					for r in rows:
-						date = r.get("crash_date") or ""
-						time = r.get("crash_time") or ""
-						r["crash_datetime"] = (date + " " + time).strip()
-				return rows
-
-	# combine date/time when possible
-	if "crash_date" in df.columns:
-		time_col = "crash_time" if "crash_time" in df.columns else None
-		if time_col:
-			df["crash_datetime"] = pd.to_datetime(
-				df["crash_date"].astype(str).str.strip() + " " + df[time_col].astype(str).str.strip(),
-				errors="coerce",
-			)
-		else:
-			df["crash_datetime"] = pd.to_datetime(df["crash_date"], errors="coerce")
+				return _read_dict_rows(fh, max_rows, columns)
+
+	# combine date/time and cast categoricals
+	df = _finalize_frame(pd, df)
+	if write_sidecar:
+		_write_parquet_sidecar(df, path_obj)
+		if columns is not None:
+			wanted = set(columns)
+			if "crash_date" in wanted:
+				wanted.add("crash_datetime")
+			df = df[[name for name in df.columns if name in wanted]]
 	return df
 
-	# Prefer pandas
-	import pandas as pd  # type: ignore
-
-	df = pd.read_csv(path_obj, low_memory=False)
-	# combine date/time when possible
-	if "crash_date" in df.columns:
-		time_col = "crash_time" if "crash_time" in df.columns else None
-		if time_col:
-			df["crash_datetime"] = pd.to_datetime(
-				df["crash_date"].astype(str).str.strip() + " " + df[time_col].astype(str).str.strip(),
-				errors="coerce",
-			)
-		else:
-			df["crash_datetime"] = pd.to_datetime(df["crash_date"], errors="coerce")
-	return df
 
-
-def summarize(data: Any) -> Dict[str, Any]:
+def summarize(data: Any, head: int = 5) -> Dict[str, Any]:
 	"""Return a compact summary for a DataFrame or list-of-dicts.
 
-	Summary includes number of rows, columns (when available), and a few top counts for
-	the `contributing_factor_vehicle_1` column if present.
+	Summary includes number of rows, columns (when available), the first `head` rows, and a
+	few top counts for the `contributing_factor_vehicle_1` column if present. Pass `head=0`
+	to skip building the row preview.
 	"""
 	summary: Dict[str, Any] = {}
 	if _pandas_available() and hasattr(data, "shape"):
 		# pandas DataFrame
-		import pandas as pd  # type: ignore
-
+		pd = _pandas()
 		df = data
 		summary["rows"] = int(df.shape[0])
 		summary["columns"] = int(df.shape[1])
-		summary["head"] = df.head(5).to_dict(orient="records")
+		summary["head"] = df.head(head).to_dict(orient="records") if head > 0 else []
 		if "contributing_factor_vehicle_1" in df.columns:
-			summary["top_contributing_factors"] = (
-				df["contributing_factor_vehicle_1"].value_counts(dropna=True).head(10).to_dict()
-			)
-		# missing counts for a few important numeric columns if present
-		for col in [
-			"number_of_persons_injured",
-			"number_of_persons_killed",
-			"number_of_pedestrians_injured",
-		]:
-			if col in df.columns:
-				summary[f"missing_{col}"] = int(df[col].isna().sum())
+			summary["top_contributing_factors"] = _top_counts(df["contributing_factor_vehicle_1"], 10)
+		# missing counts for a few important numeric columns if present (one isna pass)
+		cols = [
+			c
+			for c in ("number_of_persons_injured", "number_of_persons_killed", "number_of_pedestrians_injured")
+			if c in df.columns
+		]
+		if cols:
+			missing = df[cols].isna().sum()
+			for col in cols:
+				summary[f"missing_{col}"] = int(missing[col])
 	else:
 		# assume list of dicts
 		rows = data if isinstance(data, list) else []
 		summary["rows"] = len(rows)
 		summary["columns"] = len(rows[0].keys()) if rows else 0
-		summary["head"] = rows[:5]
+		summary["head"] = rows[:head] if head > 0 else []
 		# top contributing factor
-		counts: Dict[str, int] = {}
-		for r in rows:
-			k = r.get("contributing_factor_vehicle_1")
-			if k:
-				counts[k] = counts.get(k, 0) + 1
-		summary["top_contributing_factors"] = dict(
-			sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:10]
-		)
+		counts = Counter(k for k in (r.get("contributing_factor_vehicle_1") for r in rows) if k)
+		summary["top_contributing_factors"] = dict(counts.most_common(10))
 
 	return summary
 
@@ -396,10 +779,12 @@ def _cli() -> None:
 	parser.add_argument("file", help="Path to the accidents CSV file")
 	parser.add_argument("--no-pandas", action="store_true", help="Force fallback to csv reader instead of pandas")
 	parser.add_argument("--preview", "-n", type=int, default=5, help="Number of preview rows to show")
+	parser.add_argument("--cols-minimal", action="store_true", help="Only parse the columns used by the summary and stats")
 	args = parser.parse_args()
 
-	data = read_accidents_csv(args.file, use_pandas=not args.no_pandas)
-	s = summarize(data)
+	columns = DEFAULT_COLUMNS if args.cols_minimal else None
+	data = read_accidents_csv(args.file, use_pandas=not args.no_pandas, columns=columns)
+	s = summarize(data, head=min(args.preview, 5))
 
 	# print brief summary
 	print("=== Summary ===")
@@ -420,22 +805,24 @@ if __name__ == "__main__":
 
 
 # Convenience wrapper for programmatic use from other modules (e.g. `main.py`)
-def load_and_preview(path: str, preview: int = 5, use_pandas: Optional[bool] = None, start_date: str | None = None, end_date: str | None = None, force_update: bool = False):
+def load_and_preview(path: str, preview: int = 5, use_pandas: Optional[bool] = None, start_date: str | None = None, end_date: str | None = None, force_update: bool = False, max_rows: Optional[int] = None):
 		"""Load the CSV and return a tuple (data, summary) where `summary['preview']`
 		contains up to `preview` rows for display.
 
 		- `data` is a pandas.DataFrame when pandas is available (and used) or a list[dict] when
 			falling back to the csv module.
 		- `summary` is the same structure returned by `summarize` with an added `preview` key.
+		- `max_rows` limits the read to the first rows of the file; pass `max_rows=preview`
+			when only the preview is needed so I/O scales with the preview, not the file.
 		"""
-		data = read_accidents_csv(path, use_pandas=use_pandas, start_date=start_date, end_date=end_date, force_update=force_update)
-		summary = summarize(data)
+		data = read_accidents_csv(path, use_pandas=use_pandas, start_date=start_date, end_date=end_date, force_update=force_update, max_rows=max_rows)
+		summary = summarize(data, head=min(preview, 5))
 		summary["preview"] = summary.get("head", [])[:preview]
 		return data, summary
 
 
 # Helper utilities for filtering and reporting
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import List, Tuple
 
 
@@ -446,62 +833,87 @@ def _ensure_crash_datetime(data: Any):
 	falls back to a handful of common formats.
 	"""
 	if _pandas_available() and hasattr(data, "shape"):
-		import pandas as pd  # type: ignore
+		pd = _pandas()
 		df = data
 		if "crash_datetime" not in df.columns and "crash_date" in df.columns:
-			time_col = "crash_time" if "crash_time" in df.columns else None
-			if time_col:
-				df["crash_datetime"] = pd.to_datetime(
-					df["crash_date"].astype(str).str.strip() + " " + df[time_col].astype(str).str.strip(),
-					errors="coerce",
-				)
-			else:
-				df["crash_datetime"] = pd.to_datetime(df["crash_date"], errors="coerce")
+			df["crash_datetime"] = _combine_crash_datetime(pd, df)
 		return df
 
 	# list-of-dicts fallback
 	rows = data if isinstance(data, list) else []
-	# try dateutil parser if available
+	# try ciso8601 (fast ISO 8601) and dateutil parsers if available
+	try:
+		from ciso8601 import parse_datetime_as_naive as _parse_iso  # type: ignore
+	except Exception:
+		_parse_iso = None
 	try:
 		from dateutil.parser import parse as _parse_date  # type: ignore
 	except Exception:
 		_parse_date = None
 
 	formats = ("%Y-%m-%d %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y", "%Y-%m-%d")
+	# most crashes share a date and minute, so each distinct string is parsed only once
+	cache: Dict[str, Optional[datetime]] = {}
+
+	def _parse(text: str) -> Optional[datetime]:
+		if text in cache:
+			return cache[text]
+		parsed = None
+		for parser in (_parse_iso, _parse_date, datetime.fromisoformat):
+			if parser is None:
+				continue
+			try:
+				parsed = parser(text)
+				break
+			except Exception:
+				continue
+		if parsed is None:
+			for fmt in formats:
+				try:
+					parsed = datetime.strptime(text, fmt)
+					break
+				except Exception:
+					continue
+		cache[text] = parsed
+		return parsed
+
 	for r in rows:
 		# if crash_datetime is present but is a string, try to parse it
 		cdval = r.get("crash_datetime")
-		if cdval and not isinstance(cdval, (datetime,)):
-			# attempt to parse existing string
+		if isinstance(cdval, datetime):
+			continue
+		if cdval.__class__ is str:
+			hit = cache.get(cdval)
+			if hit is not None:
+				r["crash_datetime"] = hit
+				continue
+		date_s = r.get("crash_date") or ""
+		if _parse_iso is not None and date_s[4:5] == "-" and date_s[7:8] == "-":
+			# Socrata serves "2021-09-11T00:00:00.000" + "2:39"; rebuild strict ISO 8601 for ciso8601
+			time_s = (r.get("crash_time") or "").strip()
 			try:
-				if _parse_date:
-					r["crash_datetime"] = _parse_date(str(cdval))
-					continue
+				parsed = _parse_iso(date_s[:10] + "T" + time_s.zfill(5) if time_s else date_s[:10])
 			except Exception:
-				pass
+				parsed = None
+			if parsed is not None:
+				if cdval.__class__ is str:
+					cache[cdval] = parsed
+				r["crash_datetime"] = parsed
+				continue
+		if cdval:
+			parsed = _parse(str(cdval))
+			if parsed is not None:
+				r["crash_datetime"] = parsed
+				continue
 		# if no crash_datetime or still not parsed, try combine date/time
 		date_s = (r.get("crash_date") or "").strip()
 		time_s = (r.get("crash_time") or "").strip()
 		joined = (date_s + " " + time_s).strip()
 		if not joined:
 			continue
-		# try dateutil
-		if _parse_date:
-			try:
-				r["crash_datetime"] = _parse_date(joined)
-				continue
-			except Exception:
-				pass
-		# try isoformat
-		try:
-			r["crash_datetime"] = datetime.fromisoformat(joined)
-		except Exception:
-			for fmt in formats:
-				try:
-					r["crash_datetime"] = datetime.strptime(joined, fmt)
-					break
-				except Exception:
-					continue
+		parsed = _parse(joined)
+		if parsed is not None:
+			r["crash_datetime"] = parsed
 	return rows
 
 
@@ -511,14 +923,110 @@ def filter_by_date_range(data: Any, start: date, end: date):
 	Works with pandas.DataFrame or list[dict]. `start` and `end` should be `datetime.date` objects.
 	"""
 	if _pandas_available() and hasattr(data, "shape"):
+		pd = _pandas()
 		df = _ensure_crash_datetime(data)
-		mask = df["crash_datetime"].dt.date.between(start, end)
-		return df.loc[mask].copy()
+		import numpy as np  # type: ignore
+		# compare the raw datetime64 array (no index alignment); the end bound is the next midnight
+		crash_dt = df["crash_datetime"].to_numpy()
+		mask = (crash_dt >= np.datetime64(start, "D")) & (crash_dt < np.datetime64(end + timedelta(days=1), "D"))
+		out = df.loc[mask].copy()
+		# keep categoricals limited to the values that survive the filter
+		for col in CATEGORY_COLUMNS:
+			if col in out.columns and isinstance(out[col].dtype, pd.CategoricalDtype):
+				out[col] = out[col].cat.remove_unused_categories()
+		return out
 	else:
 		rows = _ensure_crash_datetime(data)
-		out = [r for r in rows if isinstance(r.get("crash_datetime"), (datetime,)) and start <= r["crash_datetime"].date() <= end]
+		# compare datetimes against precomputed bounds instead of calling .date() on every row
+		lo = datetime.combine(start, datetime.min.time())
+		hi = datetime.combine(end, datetime.min.time()) + timedelta(days=1)
+		out = [r for r in rows if isinstance(dt := r.get("crash_datetime"), datetime) and lo <= dt < hi]
 		return out
 
+def contains_mask(df, columns: Sequence[str], term: str):
+	"""Return a boolean Series marking rows where any of `columns` contains `term` (case-insensitive).
+
+	The term is matched literally (no regex), so user input such as "4X4 (SUV)" is safe to pass.
+	Columns missing from `df` are skipped.
+	"""
+	pd = _pandas()
+	mask = pd.Series(False, index=df.index)
+	for col in columns:
+		if col not in df.columns:
+			continue
+		series = df[col]
+		try:
+			# on categoricals this runs once per category, not once per row
+			hit = series.str.contains(term, case=False, na=False, regex=False)
+		except AttributeError:
+			# all-empty columns are parsed as float; only stringify the non-null values
+			values = series.dropna()
+			if values.empty:
+				continue
+			hit = values.astype(str).str.contains(term, case=False, regex=False).reindex(series.index, fill_value=False)
+		mask |= hit.to_numpy(dtype=bool)
+	return mask
+
+def count_across_columns(df, columns: Sequence[str]):
+	"""Return value counts pooled across `columns` (descending), skipping missing and empty values.
+
+	Each column is counted on its own (integer-code counts for categoricals) and the small
+	per-column tables are summed, instead of stacking every cell into one long Series.
+	"""
+	pd = _pandas()
+	parts = []
+	for col in columns:
+		if col in df.columns:
+			counts = df[col].value_counts()
+			parts.append(counts[counts > 0])
+	if not parts:
+		return pd.Series(dtype="int64")
+	pooled = pd.concat(parts)
+	pooled.index = pooled.index.astype(str)
+	pooled = pooled[pooled.index != ""].groupby(level=0).sum()
+	# stable sort keeps ties in alphabetical order
+	return pooled.sort_values(ascending=False, kind="stable")
+
+
+def _as_int(value: Any) -> int:
+	"""Coerce a CSV cell to int, treating blanks and unparsable values as 0."""
+	if value.__class__ is str and value.isdigit():
+		return int(value)
+	try:
+		return int(value or 0)
+	except Exception:
+		return 0
+
+
+def _frame_brief_stats(pd, df) -> dict:
+	"""Totals and top streets of a DataFrame: the part of `compute_stats` a brief summary shows."""
+	stats = {"total_accidents": int(df.shape[0])}
+	# numeric sums (handle missing / non-numeric)
+	for col in ["number_of_persons_injured", "number_of_persons_killed"]:
+		if col in df.columns:
+			values = df[col]
+			if not pd.api.types.is_numeric_dtype(values):
+				values = pd.to_numeric(values, errors="coerce")
+			# sum() skips NaN, so no fillna copy is needed
+			stats[col] = int(values.sum())
+		else:
+			stats[col] = 0
+	# top streets
+	if "on_street_name" in df.columns:
+		stats["top_streets"] = _top_counts(df["on_street_name"], 10)
+	else:
+		stats["top_streets"] = {}
+	return stats
+
+
+def compute_brief_stats(data: Any) -> dict:
+	"""Compute the totals and top streets of `compute_stats`, skipping the month and vehicle counts."""
+	if _pandas_available() and hasattr(data, "shape"):
+		return _frame_brief_stats(_pandas(), data)
+	stats = compute_stats(data)
+	return {key: stats[key] for key in ("total_accidents", "number_of_persons_injured", "number_of_persons_killed", "top_streets")}
+
+
 def compute_stats(data: Any) -> dict:
 	"""Compute simple stats required by the assignment:
 
@@ -536,35 +1044,23 @@ def compute_stats(data: Any) -> dict:
 		"vehicle_type_code5",
 	]
 	if _pandas_available() and hasattr(data, "shape"):
-		import pandas as pd  # type: ignore
+		pd = _pandas()
 		df = _ensure_crash_datetime(data)
-		stats["total_accidents"] = int(df.shape[0])
-		# numeric sums (handle missing / non-numeric)
-		for col in ["number_of_persons_injured", "number_of_persons_killed"]:
-			if col in df.columns:
-				stats[col] = int(pd.to_numeric(df[col], errors="coerce").fillna(0).sum())
-			else:
-				stats[col] = 0
-		# top streets
-		if "on_street_name" in df.columns:
-			stats["top_streets"] = df["on_street_name"].value_counts(dropna=True).head(10).to_dict()
-		else:
-			stats["top_streets"] = {}
+		stats.update(_frame_brief_stats(pd, df))
 		# top months (limit to top 5)
 		if "crash_datetime" in df.columns:
-			df = df.copy()
-			df["_month"] = df["crash_datetime"].dt.to_period("M")
-			stats["top_months"] = df["_month"].value_counts().head(5).to_dict()
+			# count integer month codes (no frame copy, no per-row Period objects), then label the top 5
+			crash_dt = df["crash_datetime"].dt
+			month_codes = crash_dt.year * 12 + crash_dt.month - 1
+			stats["top_months"] = {
+				pd.Period(year=int(code) // 12, month=int(code) % 12 + 1, freq="M"): int(count)
+				for code, count in month_codes.value_counts().head(5).items()
+			}
 		else:
 			stats["top_months"] = {}
 		# top vehicles (aggregate across vehicle columns)
 		if any(c in df.columns for c in vehicle_cols):
-			vals = []
-			for c in vehicle_cols:
-				if c in df.columns:
-					vals.extend(df[c].dropna().astype(str).tolist())
-			stacked = pd.Series(vals)
-			stats["top_vehicles"] = stacked.value_counts().head(5).to_dict()
+			stats["top_vehicles"] = count_across_columns(df, vehicle_cols).head(5).to_dict()
 		else:
 			stats["top_vehicles"] = {}
 	else:
@@ -572,38 +1068,37 @@ def compute_stats(data: Any) -> dict:
 		stats["total_accidents"] = len(rows)
 		inj = 0
 		killed = 0
-		street_counts: Dict[str, int] = {}
-		month_counts: Dict[str, int] = {}
-		vehicle_counts: Dict[str, int] = {}
+		street_counts: Counter = Counter()
+		month_counts: Counter = Counter()
+		vehicle_counts: Counter = Counter()
+		# local binds keep the hot loop off global lookups
+		as_int = _as_int
+		dt_type = datetime
 		for r in rows:
+			get = r.get
 			# numeric sums
-			try:
-				inj += int(r.get("number_of_persons_injured") or 0)
-			except Exception:
-				pass
-			try:
-				killed += int(r.get("number_of_persons_killed") or 0)
-			except Exception:
-				pass
+			inj += as_int(get("number_of_persons_injured"))
+			killed += as_int(get("number_of_persons_killed"))
 			# street
-			sn = r.get("on_street_name") or ""
+			sn = get("on_street_name")
 			if sn:
-				street_counts[sn] = street_counts.get(sn, 0) + 1
-			# month
-			dt = r.get("crash_datetime")
-			if isinstance(dt, datetime):
-				m = dt.strftime("%Y-%m")
-				month_counts[m] = month_counts.get(m, 0) + 1
+				street_counts[sn] += 1
+			# month (integer code; only the winners are formatted below)
+			dt = get("crash_datetime")
+			if isinstance(dt, dt_type):
+				month_counts[dt.year * 12 + dt.month - 1] += 1
 			# vehicles
 			for c in vehicle_cols:
-				v = (r.get(c) or "")
+				v = get(c)
 				if v:
-					vehicle_counts[v] = vehicle_counts.get(v, 0) + 1
+					vehicle_counts[v] += 1
 		stats["number_of_persons_injured"] = inj
 		stats["number_of_persons_killed"] = killed
-		stats["top_streets"] = dict(sorted(street_counts.items(), key=lambda kv: kv[1], reverse=True)[:10])
-		stats["top_months"] = dict(sorted(month_counts.items(), key=lambda kv: kv[1], reverse=True)[:5])
-		stats["top_vehicles"] = dict(sorted(vehicle_counts.items(), key=lambda kv: kv[1], reverse=True)[:5])
+		stats["top_streets"] = dict(street_counts.most_common(10))
+		stats["top_months"] = {
+			f"{code // 12:04d}-{code % 12 + 1:02d}": count for code, count in month_counts.most_common(5)
+		}
+		stats["top_vehicles"] = dict(vehicle_counts.most_common(5))
 	return stats
 
 
@@ -617,13 +1112,12 @@ def export_report_csv(stats: dict, outpath: str):
 	with p.open("w", encoding="utf-8", newline="") as fh:
 		w = csv.writer(fh)
 		w.writerow(["metric", "value"])
-		for k, v in stats.items():
-			if isinstance(v, dict):
-				val = "; ".join([f"{kk}:{vv}" for kk, vv in v.items()])
-			else:
-				val = str(v)
-			w.writerow([k, val])
+		# one writerows call; csv keeps quoting values that contain commas (e.g. street names)
+		w.writerows(
+			(k, "; ".join(f"{kk}:{vv}" for kk, vv in v.items()) if isinstance(v, dict) else str(v))
+			for k, v in stats.items()
+		)
 
 
-__all__ = ["read_accidents_csv", "summarize", "load_and_preview", "filter_by_date_range", "compute_stats", "export_report_csv", "pull_and_cache_nyc_crashes"]
+__all__ = ["read_accidents_csv", "summarize", "load_and_preview", "filter_by_date_range", "contains_mask", "count_across_columns", "compute_brief_stats", "compute_stats", "export_report_csv", "pull_and_cache_nyc_crashes"]
 
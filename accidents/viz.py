@@ -4,14 +4,82 @@ Functions are optional and attempt to import matplotlib/folium at runtime. They
 either a pandas.DataFrame or list[dict] (similar to Datapull helpers).
 """
 from __future__ import annotations
-from typing import Any
+import functools
+import re
+import threading
+from typing import Any, Optional
 
+# One Agg-backed figure is reused by every plot_* helper; the lock serializes renders
+# because the web and desktop apps call these from worker threads.
+_FIG = None
+_FIG_LOCK = threading.Lock()
 
-def _as_df(data: Any):
+# Two decimal numbers in a free-form "location" cell, e.g. "(40.71, -73.99)"
+_LOC_RE = re.compile(r"([+-]?\d+\.\d+).*?([+-]?\d+\.\d+)")
+
+# Heatmap points are pre-aggregated on a grid of 1/_HEATMAP_GRID degree cells (~200 m in NYC),
+# so the HTML carries one weighted point per occupied cell instead of one per crash.
+_HEATMAP_GRID = 500
+
+
+@functools.lru_cache(maxsize=None)
+def _require_plotting():
+    """Return the pandas module, raising RuntimeError if pandas or matplotlib is missing.
+
+    Cached, so the import checks run once per process rather than on every plot call.
+    """
     try:
+        import matplotlib.figure  # type: ignore  # noqa: F401
         import pandas as pd  # type: ignore
-    except Exception:
-        pd = None
+    except Exception as exc:
+        raise RuntimeError("matplotlib and pandas are required for plotting: install via pip") from exc
+    return pd
+
+
+@functools.lru_cache(maxsize=None)
+def _require_folium():
+    """Return `(folium, HeatMap, pandas)`, raising RuntimeError if any is missing (cached)."""
+    try:
+        import folium  # type: ignore
+        from folium.plugins import HeatMap  # type: ignore
+        import pandas as pd  # type: ignore
+    except Exception as exc:
+        raise RuntimeError("folium and pandas are required for heatmap generation: install via pip") from exc
+    return folium, HeatMap, pd
+
+
+def _shared_figure(figsize: tuple):
+    """Return the shared figure, cleared and resized to `figsize`; hold `_FIG_LOCK` while using it.
+
+    Uses `matplotlib.figure.Figure` directly (PNG output goes through Agg), so pyplot's
+    backend selection and figure registry are never touched.
+    """
+    global _FIG
+    if _FIG is None:
+        from matplotlib.figure import Figure  # type: ignore
+
+        _FIG = Figure()
+    _FIG.clf()
+    _FIG.set_size_inches(figsize)
+    return _FIG
+
+
+def _barh_ranked(ax, names, values) -> None:
+    """Draw a horizontal bar chart with the first (largest) entry at the top.
+
+    Bars sit at integer positions with `names` as tick labels, so matplotlib's string
+    category conversion is skipped and labels that parse as dates or numbers stay literal.
+    """
+    y = range(len(names))
+    ax.barh(y, values)
+    ax.set_yticks(y, labels=[str(n) for n in names])
+    ax.invert_yaxis()
+
+
+def _as_df(data: Any):
+    from .datapull import _pandas
+
+    pd = _pandas()
     if pd is not None and hasattr(data, "shape"):
         return data
     # convert list[dict] to DataFrame if pandas present
@@ -23,12 +91,7 @@ def _as_df(data: Any):
 
 def plot_monthly_counts(data: Any, out_png: str = "static/plots/monthly_counts.png"):
     """Plot monthly counts (saves PNG)."""
-    pd = None
-    try:
-        import matplotlib.pyplot as plt  # type: ignore
-        import pandas as pd  # type: ignore
-    except Exception as exc:
-        raise RuntimeError("matplotlib and pandas are required for plotting: install via pip") from exc
+    pd = _require_plotting()
 
     # Ensure crash_datetime exists and has datetime dtype using Datapull helper
     from .datapull import _ensure_crash_datetime
@@ -39,101 +102,92 @@ def plot_monthly_counts(data: Any, out_png: str = "static/plots/monthly_counts.p
     else:
         df = pd.DataFrame(ensured)
     # Ensure 'crash_datetime' is a datetime column
-    if pd.api.types.is_datetime64_any_dtype(df['crash_datetime']):
-        df["month"] = df["crash_datetime"].dt.to_period("M")
-    else:
+    if not pd.api.types.is_datetime64_any_dtype(df['crash_datetime']):
         raise ValueError("The 'crash_datetime' column must be of datetime type.")
-    counts = df["month"].value_counts().sort_index()
-
-    plt.figure(figsize=(10, 5))
-    counts.plot(kind="bar")
-    plt.title("Accidents per month")
-    plt.xlabel("Month")
-    plt.ylabel("Count")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    # period[M] is int64-backed, so this count stays vectorized; don't add a column to the caller's frame
+    counts = df["crash_datetime"].dt.to_period("M").value_counts().sort_index()
+
+    with _FIG_LOCK:
+        fig = _shared_figure((10, 5))
+        ax = fig.add_subplot()
+        ax.bar(counts.index.astype(str), counts.to_numpy())
+        ax.tick_params(axis="x", labelrotation=90)
+        ax.set_title("Accidents per month")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Count")
+        fig.tight_layout()
+        fig.savefig(out_png)
     return out_png
 
 
-def plot_top_streets(data: Any, out_png: str = "static/plots/top_streets.png", top_n: int = 10):
-    """Plot top streets bar chart using counts from compute_stats or derived from data."""
-    try:
-        import matplotlib.pyplot as plt  # type: ignore
-        import pandas as pd  # type: ignore
-    except Exception as exc:
-        raise RuntimeError("matplotlib and pandas are required for plotting: install via pip") from exc
+def plot_top_streets(data: Any, out_png: str = "static/plots/top_streets.png", top_n: int = 10, stats: Optional[dict] = None):
+    """Plot top streets bar chart using counts from `stats` (compute_stats output) or derived from data."""
+    _require_plotting()
 
-    from .datapull import compute_stats
+    if stats is None:
+        from .datapull import compute_stats
 
-    stats = compute_stats(data)
+        stats = compute_stats(data)
 
     top = stats.get("top_streets", {})
     names = list(top.keys())[:top_n]
     values = [top[n] for n in names]
 
-    plt.figure(figsize=(10, 5))
-    plt.barh(names[::-1], values[::-1])
-    plt.title(f"Top {len(names)} streets by accidents")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    with _FIG_LOCK:
+        fig = _shared_figure((10, 5))
+        ax = fig.add_subplot()
+        _barh_ranked(ax, names, values)
+        ax.set_title(f"Top {len(names)} streets by accidents")
+        fig.tight_layout()
+        fig.savefig(out_png)
     return out_png
 
 
-def plot_top_months(data: Any, out_png: str = "static/plots/top_months.png", top_n: int = 5):
+def plot_top_months(data: Any, out_png: str = "static/plots/top_months.png", top_n: int = 5, stats: Optional[dict] = None):
     """Plot top N months by accident count."""
-    try:
-        import matplotlib.pyplot as plt  # type: ignore
-        import pandas as pd  # type: ignore
-    except Exception as exc:
-        raise RuntimeError("matplotlib and pandas are required for plotting: install via pip") from exc
+    _require_plotting()
 
-    from .datapull import compute_stats
-    stats = compute_stats(data)
+    if stats is None:
+        from .datapull import compute_stats
+        stats = compute_stats(data)
     top = stats.get("top_months", {})
     names = [str(n) for n in list(top.keys())[:top_n]]
     values = [top[n] for n in list(top.keys())[:top_n]]
 
-    plt.figure(figsize=(8, 4))
-    plt.barh(names[::-1], values[::-1])
-    plt.title(f"Top {len(names)} months by accidents")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    with _FIG_LOCK:
+        fig = _shared_figure((8, 4))
+        ax = fig.add_subplot()
+        _barh_ranked(ax, names, values)
+        ax.set_title(f"Top {len(names)} months by accidents")
+        fig.tight_layout()
+        fig.savefig(out_png)
     return out_png
 
 
-def plot_top_vehicles(data: Any, out_png: str = "static/plots/top_vehicles.png", top_n: int = 5):
+def plot_top_vehicles(data: Any, out_png: str = "static/plots/top_vehicles.png", top_n: int = 5, stats: Optional[dict] = None):
     """Plot top N vehicle types by occurrence across all vehicle columns."""
-    try:
-        import matplotlib.pyplot as plt  # type: ignore
-        import pandas as pd  # type: ignore
-    except Exception as exc:
-        raise RuntimeError("matplotlib and pandas are required for plotting: install via pip") from exc
+    _require_plotting()
 
-    from .datapull import compute_stats
-    stats = compute_stats(data)
+    if stats is None:
+        from .datapull import compute_stats
+        stats = compute_stats(data)
     top = stats.get("top_vehicles", {})
     names = list(top.keys())[:top_n]
     values = [top[n] for n in names]
 
-    plt.figure(figsize=(8, 4))
-    plt.barh(names[::-1], values[::-1])
-    plt.title(f"Top {len(names)} vehicle types")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    with _FIG_LOCK:
+        fig = _shared_figure((8, 4))
+        ax = fig.add_subplot()
+        _barh_ranked(ax, names, values)
+        ax.set_title(f"Top {len(names)} vehicle types")
+        fig.tight_layout()
+        fig.savefig(out_png)
     return out_png
 
 
 def plot_boroughs(data: Any, out_png: str = "static/plots/boroughs.png"):
     """Plot accident counts by borough."""
-    try:
-        import matplotlib.pyplot as plt  # type: ignore
-        import pandas as pd  # type: ignore
-    except Exception as exc:
-        raise RuntimeError("matplotlib and pandas are required for plotting: install via pip") from exc
+    pd = _require_plotting()
 
     df = _as_df(data)
     if not hasattr(df, "shape"):
@@ -142,35 +196,55 @@ def plot_boroughs(data: Any, out_png: str = "static/plots/boroughs.png"):
     if "borough" not in df.columns:
         raise ValueError("No 'borough' column found in data")
 
-    borough_counts = df["borough"].value_counts(dropna=True).sort_values(ascending=True)
-
-    plt.figure(figsize=(10, 6))
-    borough_counts.plot(kind="barh", color="steelblue")
-    plt.title("Accidents by Borough")
-    plt.xlabel("Count")
-    plt.ylabel("Borough")
-    plt.tight_layout()
-    plt.savefig(out_png)
-    plt.close()
+    # borough is categorical when loaded through read_accidents_csv, so this counts int codes;
+    # skip value_counts' own descending sort since the chart wants ascending order
+    borough_counts = df["borough"].value_counts(dropna=True, sort=False)
+    borough_counts = borough_counts[borough_counts > 0].sort_values(ascending=True)
+
+    with _FIG_LOCK:
+        fig = _shared_figure((10, 6))
+        ax = fig.add_subplot()
+        ax.barh(borough_counts.index.astype(str), borough_counts.to_numpy(), color="steelblue")
+        ax.set_title("Accidents by Borough")
+        ax.set_xlabel("Count")
+        ax.set_ylabel("Borough")
+        fig.tight_layout()
+        fig.savefig(out_png)
     return out_png
 
 
+def _bin_points(points):
+    """Aggregate an (N, 2) lat/lon array into `[lat, lon, count]` rows, one per grid cell.
+
+    Each cell is packed into a single int64 key so the grouping is one 1-D np.unique
+    (sorting (N, 2) rows with `axis=0` is ~40x slower); rounded centres also serialize short.
+    """
+    import numpy as np  # type: ignore
+
+    cells = np.round(points * _HEATMAP_GRID).astype(np.int64)
+    # |lon| <= 180 deg -> |lon cell| < 100_000, so the offset column always fits below 10**6
+    keys, weights = np.unique(cells[:, 0] * 1_000_000 + (cells[:, 1] + 100_000), return_counts=True)
+    lat, lon = np.divmod(keys, 1_000_000)
+    return np.column_stack((lat / _HEATMAP_GRID, (lon - 100_000) / _HEATMAP_GRID, weights)).tolist()
+
+
 def generate_folium_heatmap(data: Any, out_html: str = "static/maps/heatmap.html"):
     """Generate a folium heatmap HTML file from latitude/longitude columns.
 
     Requires `folium` be installed.
     """
-    try:
-        import folium  # type: ignore
-        from folium.plugins import HeatMap  # type: ignore
-        import pandas as pd  # type: ignore
-    except Exception as exc:
-        raise RuntimeError("folium and pandas are required for heatmap generation: install via pip") from exc
-
-    # Ensure DataFrame
-    df = _as_df(data)
-    if not hasattr(df, "shape"):
-        df = pd.DataFrame(df)
+    folium, HeatMap, pd = _require_folium()
+    import numpy as np  # type: ignore
+
+    # Ensure DataFrame; list rows only need the coordinate columns
+    if isinstance(data, list):
+        keys = data[0].keys() if data else ()
+        wanted = [c for c in ("latitude", "lat", "longitude", "lon", "location") if c in keys]
+        df = pd.DataFrame.from_records(data, columns=wanted)
+    else:
+        df = _as_df(data)
+        if not hasattr(df, "shape"):
+            df = pd.DataFrame(df)
 
     # filter rows with valid lat/lon
     lat_col = "latitude" if "latitude" in df.columns else "lat" if "lat" in df.columns else None
@@ -178,31 +252,25 @@ def generate_folium_heatmap(data: Any, out_html: str = "static/maps/heatmap.html
     if lat_col is None or lon_col is None:
         raise ValueError("No latitude/longitude columns found for heatmap generation")
 
-    coords = df[[lat_col, lon_col]].copy()
-    # coerce to numeric where possible
-    coords[lat_col] = pd.to_numeric(coords[lat_col], errors="coerce")
-    coords[lon_col] = pd.to_numeric(coords[lon_col], errors="coerce")
-    coords = coords.dropna()
+    # coerce to float arrays and keep finite, non-zero pairs (the feed uses 0.0 for unknown)
+    lat = pd.to_numeric(df[lat_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    lon = pd.to_numeric(df[lon_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    valid = np.isfinite(lat) & np.isfinite(lon) & (lat != 0) & (lon != 0)
+    points = np.column_stack((lat[valid], lon[valid]))
 
     # If no numeric coords found, try to parse from a 'location' column like "(lat,lon)"
-    if coords.empty and "location" in df.columns:
-        import re
-        parsed = []
-        for v in df["location"].dropna().astype(str):
-            # Try robust float extraction (handles formats like "(lat,lon)", "lat, lon", or "lat lon")
-            m = re.search(r"([+-]?\d+\.\d+).*?([+-]?\d+\.\d+)", v)
-            if m:
-                parsed.append((float(m.group(1)), float(m.group(2))))
-        if parsed:
-            coords = pd.DataFrame(parsed, columns=[lat_col, lon_col])
-
-    if coords.empty:
+    if not len(points) and "location" in df.columns:
+        # one vectorized pass; handles formats like "(lat,lon)", "lat, lon", or "lat lon"
+        extracted = df["location"].dropna().astype(str).str.extract(_LOC_RE)
+        points = extracted.astype(float).dropna().to_numpy()
+
+    if not len(points):
         raise ValueError("No valid coordinates available for heatmap")
 
     # center map on median location
-    center = [float(coords[lat_col].median()), float(coords[lon_col].median())]
+    center = [float(v) for v in np.median(points, axis=0)]
     m = folium.Map(location=center, zoom_start=11)
-    HeatMap(coords.values.tolist(), radius=8, blur=15).add_to(m)
+    HeatMap(_bin_points(points), radius=8, blur=15).add_to(m)
 
     # Add a simple legend for intensity
     legend_html = """
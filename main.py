@@ -8,28 +8,53 @@ Features:
   - Interactive menu with 8 analysis options
 """
 
+from concurrent.futures import Future
 from datetime import datetime, date
 from pathlib import Path
+import hashlib
+import os
+import pickle
 import sys
+import threading
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    pd = None
+    HAS_PANDAS = False
 
 
 def _ensure_project_path():
-    here = Path(__file__).resolve().parent
-    # Always put project root on sys.path so `accidents` and helpers resolve
-    if str(here) not in sys.path:
-        sys.path.insert(0, str(here))
-    # Also add parent if run from a nested location
-    parent = here.parent
-    if str(parent) not in sys.path:
-        sys.path.insert(0, str(parent))
+    # main.py sits at the project root, which holds the `accidents` package; put it on sys.path
+    here = str(Path(__file__).resolve().parent)
+    if here not in sys.path:
+        sys.path.insert(0, here)
 
 
 _ensure_project_path()
 
-from accidents.datapull import read_accidents_csv, pull_and_cache_nyc_crashes, filter_by_date_range, compute_stats, export_report_csv
+from accidents.datapull import DEFAULT_COLUMNS, read_accidents_csv, pull_and_cache_nyc_crashes, filter_by_date_range, contains_mask, count_across_columns, compute_brief_stats, compute_stats, export_report_csv
 from accidents import viz as _viz
 from accidents import crashes_dictionaries as cd
 
+STATS_CACHE_DIR = Path("data") / "stats_cache"
+# Bump whenever compute_stats' output changes so pickles written by older code are not served
+STATS_CACHE_VERSION = 2
+
+MONTHLY_PNG = "static/plots/monthly_counts.png"
+HEATMAP_HTML = "static/maps/heatmap.html"
+
+# Columns the menus read (stats, searches, plots, heatmap); CSV export re-reads every column
+CLI_COLUMNS = DEFAULT_COLUMNS + ("latitude", "longitude", "location")
+
+# The dataset loaded for this session and its stats (computed once, shared by menu actions);
+# "subset_stats" memoizes stats of borough/vehicle/street subsets keyed by the user's choice,
+# "boroughs" memoizes the borough row subsets themselves (see get_borough_rows) and
+# "source" records (cache_path, start_date, end_date, metadata) so export can reload all columns;
+# "prewarm" maps an output path to the Future of its background render (see prewarm_outputs)
+_session = {"data": None, "stats": None, "stats_file": None, "subset_stats": {}, "boroughs": {}, "source": None, "prewarm": {}}
+
 
 def parse_date_input(date_str: str) -> date:
     """Parse date string in yyyy/mm/dd format."""
@@ -68,6 +93,26 @@ def get_date_range() -> tuple[date | None, date | None]:
         return get_date_range()
 
 
+def apply_date_range(data, start_date: date | None, end_date: date | None, metadata: dict):
+    """Filter `data` to the date range, unless the cached CSV was downloaded for exactly this range."""
+    start_iso = start_date.isoformat() if start_date else None
+    end_iso = end_date.isoformat() if end_date else None
+    already_bounded = bool(start_iso and end_iso) and metadata.get("date_range") == [start_iso, end_iso]
+    if not (start_date or end_date) or already_bounded:
+        return data
+    return filter_by_date_range(data, start_date or date(1900, 1, 1), end_date or date(2100, 12, 31))
+
+
+def load_full_data(data):
+    """Return `data` with every column, re-reading the session's source when it was loaded projected."""
+    source = _session.get("source")
+    if source is None or data is not _session["data"]:
+        return data
+    cache_path, start_date, end_date, metadata = source
+    full = read_accidents_csv(str(cache_path), use_pandas=True)
+    return apply_date_range(full, start_date, end_date, metadata)
+
+
 def load_data_with_fallback(start_date: date = None, end_date: date = None):
     """Load data from API with fallback to cache."""
     print("\n" + "="*60)
@@ -91,17 +136,17 @@ def load_data_with_fallback(start_date: date = None, end_date: date = None):
         else:
             print("⚠ Using cached data (no internet connection available)")
         
-        data = read_accidents_csv(str(cache_path), use_pandas=True)
-        
-        # Filter by date range if provided
-        if start_date or end_date:
-            if start_date and end_date:
-                data = filter_by_date_range(data, start_date, end_date)
-            elif start_date:
-                data = filter_by_date_range(data, start_date, date(2100, 12, 31))
-            else:
-                data = filter_by_date_range(data, date(1900, 1, 1), end_date)
+        data = read_accidents_csv(str(cache_path), use_pandas=True, columns=CLI_COLUMNS)
+        data = apply_date_range(data, start_date, end_date, metadata)
         
+        _session.update(
+            data=data,
+            stats=None,
+            stats_file=_stats_cache_file(cache_path, start_iso, end_iso),
+            subset_stats={},
+            boroughs={},
+            source=(cache_path, start_date, end_date, metadata),
+        )
         return data, metadata
     
     except FileNotFoundError as e:
@@ -115,9 +160,151 @@ def load_data_with_fallback(start_date: date = None, end_date: date = None):
         sys.exit(1)
 
 
+def _stats_cache_file(csv_path, start_iso, end_iso):
+    """Return the on-disk stats cache path for this CSV version and date range, or None.
+
+    Files are named `<csv>_<version>_<range>.pkl`, where <version> covers the CSV's mtime and
+    size and STATS_CACHE_VERSION, so _prune_stats_cache can drop outdated results for a CSV.
+    """
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return None
+
+    def digest(text):
+        return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+    csv_key = digest(str(Path(csv_path).resolve()))
+    version_key = digest(f"{st.st_mtime_ns}|{st.st_size}|{STATS_CACHE_VERSION}")
+    return STATS_CACHE_DIR / f"{csv_key}_{version_key}_{digest(f'{start_iso}|{end_iso}')}.pkl"
+
+
+def _prune_stats_cache(stats_file):
+    """Delete cached stats of the same CSV written for an older CSV version or STATS_CACHE_VERSION.
+
+    Files in the pre-versioned `<hash>.pkl` layout are deleted as well.
+    """
+    csv_key, version_key, _ = stats_file.stem.split("_")
+    for old in stats_file.parent.glob("*.pkl"):
+        parts = old.stem.split("_")
+        if len(parts) != 3 or (parts[0] == csv_key and parts[1] != version_key):
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def get_stats(data):
+    """Return compute_stats(data), reusing the result for the loaded dataset.
+
+    Stats for the session's dataset are computed at most once per run and persisted under
+    STATS_CACHE_DIR, so a later run over the same cached CSV and date range skips them.
+    """
+    if data is not _session["data"]:
+        return compute_stats(data)
+    if _session["stats"] is None:
+        stats_file = _session["stats_file"]
+        stats = None
+        if stats_file is not None and stats_file.exists():
+            try:
+                with stats_file.open("rb") as fh:
+                    stats = pickle.load(fh)
+            except Exception:
+                stats = None
+        if stats is None:
+            stats = compute_stats(data)
+            if stats_file is not None:
+                try:
+                    stats_file.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = stats_file.with_suffix(".tmp")
+                    with tmp.open("wb") as fh:
+                        pickle.dump(stats, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                    tmp.replace(stats_file)
+                    _prune_stats_cache(stats_file)
+                except OSError:
+                    pass
+        _session["stats"] = stats
+    return _session["stats"]
+
+
+def get_brief_stats(data):
+    """Return the totals and top streets of `data`, without computing the full stats.
+
+    Reuses the full stats when they are already memoized in this run or on disk.
+    """
+    if data is _session["data"]:
+        stats_file = _session["stats_file"]
+        if _session["stats"] is not None or (stats_file is not None and stats_file.exists()):
+            return get_stats(data)
+    return compute_brief_stats(data)
+
+
+def get_borough_rows(data, borough):
+    """Return the rows of `data` in `borough`, memoized per borough for the session's dataset."""
+    if data is not _session["data"]:
+        return data[data['borough'] == borough]
+    cache = _session["boroughs"]
+    if borough not in cache:
+        cache[borough] = data[data['borough'] == borough]
+    return cache[borough]
+
+
+def get_subset_stats(data, key, subset):
+    """Return compute_stats(subset) for a subset of `data` identified by `key`.
+
+    When `data` is the session's dataset the result is memoized under `key` (e.g.
+    ("borough", "QUEENS")), so repeating a menu choice skips the recomputation.
+    """
+    if data is not _session["data"]:
+        return compute_stats(subset)
+    cache = _session["subset_stats"]
+    if key not in cache:
+        cache[key] = compute_stats(subset)
+    return cache[key]
+
+
+def _render_to(out, render, data):
+    """Render `data` to `out` via a temporary sibling file, so a crash or exit never leaves a partial file."""
+    target = Path(out)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # keep the suffix: matplotlib picks the image format from it
+    partial = target.with_name(f"{target.stem}.partial{target.suffix}")
+    render(data, str(partial))
+    partial.replace(target)
+    return out
+
+
+def prewarm_outputs(data) -> None:
+    """Render the monthly chart and heatmap on a daemon thread while the user reads the menu.
+
+    The menu handlers for options 5 and 8 wait on these Futures instead of rendering again.
+    """
+    jobs = ((MONTHLY_PNG, _viz.plot_monthly_counts), (HEATMAP_HTML, _viz.generate_folium_heatmap))
+    futures = {out: Future() for out, _ in jobs}
+
+    def run() -> None:
+        for out, render in jobs:
+            try:
+                futures[out].set_result(_render_to(out, render, data))
+            except Exception as exc:
+                futures[out].set_exception(exc)
+
+    # the handlers pop from their own copy; the thread keeps its references in `futures`
+    _session["prewarm"] = dict(futures)
+    threading.Thread(target=run, name="cli-prewarm", daemon=True).start()
+
+
+def _render(out, render, data):
+    """Return `out` from its background render if one is pending for `data`, else render it now."""
+    future = _session["prewarm"].pop(out, None)
+    if future is not None and data is _session["data"]:
+        return future.result()
+    return _render_to(out, render, data)
+
+
 def show_brief_stats(data):
     """Display brief statistics."""
-    stats = compute_stats(data)
+    stats = get_brief_stats(data)
     
     print("\n" + "="*60)
     print("BRIEF STATISTICS")
@@ -139,7 +326,7 @@ def show_brief_stats(data):
 
 def show_detailed_stats(data):
     """Display detailed statistics."""
-    stats = compute_stats(data)
+    stats = get_stats(data)
     
     print("\n" + "="*60)
     print("DETAILED STATISTICS")
@@ -172,48 +359,32 @@ def show_detailed_stats(data):
 
 def search_by_vehicle_type(data):
     """Search and filter by vehicle type."""
-    try:
-        import pandas as pd
-        has_pandas = True
-    except:
-        has_pandas = False
-    
     print("\n" + "="*60)
     print("SEARCH BY VEHICLE TYPE")
     print("="*60)
     
     # Get unique vehicle types
-    if has_pandas and hasattr(data, 'shape'):
+    if HAS_PANDAS and hasattr(data, 'shape'):
         vehicle_cols = [col for col in data.columns if 'vehicle_type' in col.lower()]
         if not vehicle_cols:
             print("❌ No vehicle type columns found")
             return
         
-        all_vehicles = {}
-        for col in vehicle_cols:
-            vehicles = data[col].value_counts().to_dict()
-            for v, count in vehicles.items():
-                if v and str(v).lower() != 'nan':
-                    all_vehicles[v] = all_vehicles.get(v, 0) + count
-        
-        all_vehicles = dict(sorted(all_vehicles.items(), key=lambda x: x[1], reverse=True))
+        top_vehicles = count_across_columns(data, vehicle_cols).head(15)
         
         print("\nAvailable Vehicle Types:")
-        for i, (vehicle, count) in enumerate(list(all_vehicles.items())[:15], 1):
+        for i, (vehicle, count) in enumerate(top_vehicles.items(), 1):
             print(f"  {i}. {vehicle} ({count})")
         
         choice = input("\nEnter vehicle type to search: ").strip().upper()
         
         # Search across all vehicle type columns
-        mask = pd.Series([False] * len(data))
-        for col in vehicle_cols:
-            mask = mask | data[col].str.upper().str.contains(choice, na=False)
-        filtered = data[mask]
+        filtered = data[contains_mask(data, vehicle_cols, choice)]
         
         print(f"\nFound {len(filtered)} accidents with vehicle type containing '{choice}'")
         
         if len(filtered) > 0:
-            stats = compute_stats(filtered)
+            stats = get_subset_stats(data, ("vehicle", choice), filtered)
             print(f"  Persons Injured: {stats.get('number_of_persons_injured', 0)}")
             print(f"  Persons Killed: {stats.get('number_of_persons_killed', 0)}")
     else:
@@ -222,13 +393,7 @@ def search_by_vehicle_type(data):
 
 def filter_by_borough(data):
     """Filter by borough with options for statistics or streets."""
-    try:
-        import pandas as pd
-        has_pandas = True
-    except:
-        has_pandas = False
-    
-    if not has_pandas or not hasattr(data, 'shape'):
+    if not HAS_PANDAS or not hasattr(data, 'shape'):
         print("⚠ Pandas required for this feature")
         return
     
@@ -240,8 +405,8 @@ def filter_by_borough(data):
         print("❌ Borough column not found")
         return
     
-    boroughs = data['borough'].value_counts().to_dict()
-    boroughs_list = sorted([b for b in boroughs.keys() if pd.notna(b) and b])
+    boroughs = data['borough'].value_counts(sort=False)
+    boroughs_list = sorted(b for b, count in boroughs.items() if b and count)
     
     print("\nAvailable Boroughs:")
     for i, borough in enumerate(boroughs_list, 1):
@@ -251,7 +416,7 @@ def filter_by_borough(data):
         choice = int(input("\nSelect borough (number): ")) - 1
         if 0 <= choice < len(boroughs_list):
             selected_borough = boroughs_list[choice]
-            borough_data = data[data['borough'] == selected_borough]
+            borough_data = get_borough_rows(data, selected_borough)
             
             print(f"\nSelected: {selected_borough}")
             print("\nOptions:")
@@ -261,7 +426,7 @@ def filter_by_borough(data):
             sub_choice = input("\nSelect option (1-2): ").strip()
             
             if sub_choice == '1':
-                stats = compute_stats(borough_data)
+                stats = get_subset_stats(data, ("borough", selected_borough), borough_data)
                 print(f"\n{selected_borough} Statistics:")
                 print(f"  Total Accidents: {stats.get('total_accidents', 0):,}")
                 print(f"  Persons Injured: {stats.get('number_of_persons_injured', 0):,}")
@@ -273,18 +438,18 @@ def filter_by_borough(data):
                         print(f"    - {street}: {count}")
             
             elif sub_choice == '2':
-                streets = borough_data['on_street_name'].value_counts().to_dict()
-                streets_list = sorted(streets.keys(), key=lambda x: streets[x], reverse=True)[:10]
+                # value_counts is already sorted descending; keep only the top 10 rather than re-sorting a dict
+                top_streets = borough_data['on_street_name'].value_counts().head(10)
                 
                 print(f"\nTop Streets in {selected_borough}:")
-                for i, street in enumerate(streets_list, 1):
-                    if pd.notna(street) and street:
-                        print(f"  {i}. {street} ({streets[street]})")
+                for i, (street, count) in enumerate(top_streets.items(), 1):
+                    if pd.notna(street) and street and count:
+                        print(f"  {i}. {street} ({count})")
                 
                 street_choice = input("\nEnter street name to filter: ").strip()
-                street_data = borough_data[borough_data['on_street_name'].str.contains(street_choice, case=False, na=False)]
+                street_data = borough_data[borough_data['on_street_name'].str.contains(street_choice, case=False, na=False, regex=False)]
                 
-                stats = compute_stats(street_data)
+                stats = get_subset_stats(data, ("street", selected_borough, street_choice.lower()), street_data)
                 print(f"\nResults for '{street_choice}':")
                 print(f"  Accidents: {len(street_data)}")
                 print(f"  Persons Injured: {stats.get('number_of_persons_injured', 0)}")
@@ -302,8 +467,7 @@ def plot_monthly_counts_menu(data):
     print("="*60)
     
     try:
-        Path("static/plots").mkdir(parents=True, exist_ok=True)
-        out = _viz.plot_monthly_counts(data, out_png="static/plots/monthly_counts.png")
+        out = _render(MONTHLY_PNG, _viz.plot_monthly_counts, data)
         print(f"✓ Monthly chart saved to {out}")
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -311,17 +475,11 @@ def plot_monthly_counts_menu(data):
 
 def plot_top_streets_menu(data):
     """Generate top streets by borough plot."""
-    try:
-        import pandas as pd
-        has_pandas = True
-    except:
-        has_pandas = False
-    
     print("\n" + "="*60)
     print("PLOTTING TOP STREETS BY BOROUGH")
     print("="*60)
     
-    if not has_pandas or not hasattr(data, 'shape'):
+    if not HAS_PANDAS or not hasattr(data, 'shape'):
         print("⚠ Pandas required for this feature")
         return
     
@@ -339,7 +497,8 @@ def plot_top_streets_menu(data):
         choice = int(input("\nSelect borough (number): ")) - 1
         if 0 <= choice < len(boroughs):
             selected_borough = boroughs[choice]
-            borough_data = data[data['borough'] == selected_borough]
+            # the chart only reads street names; don't copy the other columns of the subset
+            borough_data = data.loc[data['borough'] == selected_borough, ['on_street_name']]
             
             Path("static/plots").mkdir(parents=True, exist_ok=True)
             out = _viz.plot_top_streets(borough_data, out_png=f"static/plots/top_streets_{selected_borough}.png")
@@ -367,21 +526,14 @@ def export_data(data):
     if choice == '1':
         try:
             output_path = "data/filtered_export.csv"
-            cd.write_csv_header(output_path)
-            
-            if hasattr(data, "to_dict"):
-                rows = data.to_dict(orient="records")
-            else:
-                rows = data
-            
-            cd.append_rows_to_csv(output_path, rows)
+            cd.write_rows_to_csv(output_path, load_full_data(data))
             print(f"✓ Data exported to {output_path}")
         except Exception as e:
             print(f"❌ Error: {e}")
     
     elif choice == '2':
         try:
-            stats = compute_stats(data)
+            stats = get_stats(data)
             output_path = "data/detailed_report.csv"
             export_report_csv(stats, output_path)
             print(f"✓ Detailed report exported to {output_path}")
@@ -399,8 +551,7 @@ def generate_heatmap(data):
     print("="*60)
     
     try:
-        Path("static/maps").mkdir(parents=True, exist_ok=True)
-        out = _viz.generate_folium_heatmap(data, out_html="static/maps/heatmap.html")
+        out = _render(HEATMAP_HTML, _viz.generate_folium_heatmap, data)
         print(f"✓ Heatmap saved to {out}")
         print("  Open in a web browser to view the interactive map")
     except Exception as e:
@@ -435,6 +586,7 @@ def main():
     
     # Load data with fallback
     data, metadata = load_data_with_fallback(start_date, end_date)
+    prewarm_outputs(data)
     
     # Show data summary
     if hasattr(data, 'shape'):
@@ -27,6 +27,7 @@ from accidents.datapull import (
     pull_and_cache_nyc_crashes,
     read_accidents_csv,
     filter_by_date_range,
+    contains_mask,
     compute_stats,
     export_report_csv,
 )
@@ -387,7 +388,8 @@ class CrashApp:
     def _plot_top_streets(self, borough: str, popup: Optional[tk.Toplevel] = None) -> None:
         self._ensure_data()
         path = Path(f"static/plots/top_streets_{borough}.png")
-        self._run_plot(lambda: _viz.plot_top_streets(self.filtered[self.filtered["borough"].str.lower() == borough], out_png=str(path)), path)
+        # the chart only reads street names; don't copy the other columns of the subset
+        self._run_plot(lambda: _viz.plot_top_streets(self.filtered.loc[self.filtered["borough"].str.lower() == borough, ["on_street_name"]], out_png=str(path)), path)
         if popup:
             popup.destroy()
 
@@ -402,10 +404,7 @@ class CrashApp:
             messagebox.showinfo("Enter value", "Please enter a vehicle type substring")
             return
         vehicle_cols = [c for c in self.filtered.columns if "vehicle_type" in c.lower()]
-        mask = False
-        for col in vehicle_cols:
-            mask = mask | self.filtered[col].fillna("").astype(str).str.upper().str.contains(query.upper())
-        results = self.filtered[mask]
+        results = self.filtered[contains_mask(self.filtered, vehicle_cols, query)]
         stats = compute_stats(results)
         lines = [f"Results: {len(results)}"]
         if stats.get("top_vehicles"):
@@ -438,13 +437,9 @@ class CrashApp:
                     "vehicle_type_code4",
                     "vehicle_type_code5",
                 ]
-                mask = False
-                for c in vehicle_cols:
-                    if c in df.columns:
-                        mask = mask | df[c].fillna("").astype(str).str.lower().str.contains(vehicle_sub)
-                df = df[mask]
+                df = df[contains_mask(df, vehicle_cols, vehicle_sub)]
             if borough and "borough" in df.columns:
-                df = df[df["borough"].fillna("").astype(str).str.lower() == borough]
+                df = df[df["borough"].astype(str).str.lower() == borough]
 
             maps_dir = project_root / "static" / "maps"
             maps_dir.mkdir(parents=True, exist_ok=True)
@@ -462,9 +457,7 @@ class CrashApp:
             data_dir = project_root / "data"
             data_dir.mkdir(parents=True, exist_ok=True)
             out = data_dir / "desktop_export.csv"
-            cd.write_csv_header(out)
-            rows = self.filtered.to_dict(orient="records") if hasattr(self.filtered, "to_dict") else self.filtered
-            cd.append_rows_to_csv(out, rows)
+            cd.write_rows_to_csv(out, self.filtered)
             self._set_status(f"Exported to {out}")
             messagebox.showinfo("Export", f"Saved: {out}")
         except Exception as exc:
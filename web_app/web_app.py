@@ -29,6 +29,8 @@ from accidents.datapull import (
     read_accidents_csv, 
     pull_and_cache_nyc_crashes, 
     filter_by_date_range, 
+    contains_mask, 
+    count_across_columns, 
     compute_stats, 
     export_report_csv
 )
@@ -157,25 +159,41 @@ def search_vehicle():
         return render_template('error.html', message="No data loaded")
     
     try:
-        import pandas as pd
-        
         # Get all vehicle types
         vehicle_cols = [col for col in loaded_data.columns if 'vehicle_type' in col.lower()]
-        all_vehicles = {}
-        
-        for col in vehicle_cols:
-            vehicles = loaded_data[col].value_counts().to_dict()
-            for v, count in vehicles.items():
-                if v and str(v).lower() != 'nan':
-                    all_vehicles[v] = all_vehicles.get(v, 0) + count
-        
-        all_vehicles = dict(sorted(all_vehicles.items(), key=lambda x: x[1], reverse=True)[:20])
+        all_vehicles = count_across_columns(loaded_data, vehicle_cols).head(20).to_dict()
         
         return render_template('search_vehicle.html', vehicles=all_vehicles)
     except Exception as e:
         return render_template('error.html', message=f"Error: {e}")
 
 
+def _vehicle_mask(df, vehicle_type):
+    """Return a numpy bool mask of rows whose vehicle columns contain `vehicle_type`.
+
+    Matching is literal and case-insensitive; searching "bike"/"bicycle" excludes e-bikes.
+    The mask is positional, so it stays valid on date-filtered frames with a sparse index.
+    """
+    import numpy as np
+    import pandas as pd
+
+    vehicle_cols = [col for col in df.columns if 'vehicle_type' in col.lower()]
+    # Normalize bike vs e-bike: exclude e-bike when searching for bike/bicycle
+    if vehicle_type.strip().lower() not in {"bike", "bicycle"}:
+        return contains_mask(df, vehicle_cols, vehicle_type).to_numpy()
+    ebike_pattern = r"e[- ]?bike|electric bike|e[- ]?bicycle"
+    mask = np.zeros(len(df), dtype=bool)
+    for col in vehicle_cols:
+        col_series = df[col]
+        if pd.api.types.is_numeric_dtype(col_series):
+            # all-empty columns are parsed as float NaN
+            continue
+        match_bike = col_series.str.contains(vehicle_type, case=False, na=False, regex=False)
+        not_ebike = ~col_series.str.contains(ebike_pattern, case=False, na=False)
+        mask |= (match_bike & not_ebike).to_numpy(dtype=bool)
+    return mask
+
+
 @app.route('/search/vehicle/<vehicle_type>')
 def vehicle_results(vehicle_type):
     """Show results for specific vehicle type."""
@@ -183,24 +201,7 @@ def vehicle_results(vehicle_type):
         return render_template('error.html', message="No data loaded")
     
     try:
-        import pandas as pd
-        
-        vehicle_cols = [col for col in loaded_data.columns if 'vehicle_type' in col.lower()]
-        mask = pd.Series([False] * len(loaded_data))
-
-        exclude_ebike = vehicle_type.strip().lower() in {"bike", "bicycle"}
-        ebike_pattern = r"e[- ]?bike|electric bike|e[- ]?bicycle"
-        bike_pattern = vehicle_type.upper()
-
-        for col in vehicle_cols:
-            col_series = loaded_data[col].astype(str).str.upper()
-            match_bike = col_series.str.contains(bike_pattern, na=False)
-            if exclude_ebike:
-                not_ebike = ~col_series.str.contains(ebike_pattern, case=False, na=False)
-                match_bike = match_bike & not_ebike
-            mask = mask | match_bike
-        
-        filtered = loaded_data[mask]
+        filtered = loaded_data[_vehicle_mask(loaded_data, vehicle_type)]
         stats = compute_stats(filtered)
 
         return render_template('vehicle_results.html', 
@@ -218,26 +219,7 @@ def vehicle_results_data(vehicle_type):
         return jsonify({"error": "No data loaded"}), 500
 
     try:
-        import pandas as pd
-
-        vehicle_cols = [col for col in loaded_data.columns if 'vehicle_type' in col.lower()]
-        mask = pd.Series([False] * len(loaded_data))
-
-        # Normalize bike vs e-bike: exclude e-bike when searching for bike/bicycle
-        exclude_ebike = vehicle_type.strip().lower() in {"bike", "bicycle"}
-        ebike_pattern = r"e[- ]?bike|electric bike|e[- ]?bicycle"
-        bike_pattern = vehicle_type.upper()
-
-        for col in vehicle_cols:
-            col_series = loaded_data[col].astype(str).str.upper()
-            match_bike = col_series.str.contains(bike_pattern, na=False)
-            if exclude_ebike:
-                # remove ebike matches when user searches for bike
-                not_ebike = ~col_series.str.contains(ebike_pattern, case=False, na=False)
-                match_bike = match_bike & not_ebike
-            mask = mask | match_bike
-
-        filtered = loaded_data[mask].copy()
+        filtered = loaded_data[_vehicle_mask(loaded_data, vehicle_type)].copy()
 
         # Optional client-side search query
         q = request.args.get('q', '').strip().lower()
@@ -250,13 +232,15 @@ def vehicle_results_data(vehicle_type):
         ]
         existing_cols = [c for c in cols if c in filtered.columns]
 
-        # Clean NaN and select columns early for speed
+        # Clean NaN and select columns early for speed (object dtype so categoricals accept '')
         if existing_cols:
-            filtered = filtered[existing_cols].fillna('')
+            filtered = filtered[existing_cols].astype(object).fillna('')
 
         # Apply query filter across row text if provided
-        if q:
-            filtered = filtered[filtered.apply(lambda row: q in ' '.join(map(str, row)).lower(), axis=1)]
+        if q and len(filtered.columns):
+            text = filtered.astype(str)
+            row_text = text.iloc[:, 0].str.cat([text[c] for c in text.columns[1:]], sep=' ')
+            filtered = filtered[row_text.str.contains(q, case=False, regex=False).to_numpy(dtype=bool)]
 
         total = len(filtered)
 
@@ -282,14 +266,12 @@ def borough_list():
         return render_template('error.html', message="No data loaded")
     
     try:
-        import pandas as pd
-        
         if 'borough' not in loaded_data.columns:
             return render_template('error.html', message="Borough column not found")
         
-        boroughs = loaded_data['borough'].value_counts().to_dict()
-        borough_list = sorted([(b, count) for b, count in boroughs.items() if pd.notna(b) and b], 
-                            key=lambda x: x[1], reverse=True)
+        # value_counts already drops NaN and sorts by count descending, so no re-sort is needed
+        boroughs = loaded_data['borough'].value_counts()
+        borough_list = [(b, int(count)) for b, count in boroughs.items() if b and count]
         
         return render_template('borough_list.html', boroughs=borough_list)
     except Exception as e:
@@ -310,7 +292,7 @@ def borough_detail(borough_name):
         
         # Get top streets
         streets = borough_data['on_street_name'].value_counts().head(10).to_dict()
-        street_list = [(street, count) for street, count in streets.items() if pd.notna(street) and street]
+        street_list = [(street, count) for street, count in streets.items() if pd.notna(street) and street and count]
         
         return render_template('borough_detail.html', 
                              borough=borough_name,
@@ -352,9 +334,8 @@ def plot_streets(borough):
         return render_template('error.html', message="No data loaded")
     
     try:
-        import pandas as pd
-        
-        borough_data = loaded_data[loaded_data['borough'] == borough]
+        # the chart only reads street names; don't copy the other columns of the subset
+        borough_data = loaded_data.loc[loaded_data['borough'] == borough, ['on_street_name']]
         static_plots = Path(app.static_folder) / "plots"
         static_plots.mkdir(parents=True, exist_ok=True)
         output_path = static_plots / f"top_streets_{borough}.png"
@@ -445,14 +426,10 @@ def heatmap():
                 pass
 
         if vehicle_type:
-            mask = False
-            for c in vehicle_cols:
-                if c in df.columns:
-                    mask = mask | df[c].fillna("").astype(str).str.lower().str.contains(vehicle_type)
-            df = df[mask]
+            df = df[contains_mask(df, vehicle_cols, vehicle_type)]
 
         if borough and "borough" in df.columns:
-            df = df[df["borough"].fillna("").astype(str).str.lower() == borough]
+            df = df[df["borough"].astype(str).str.lower() == borough]
 
         static_maps = Path(app.static_folder) / "maps"
         static_maps.mkdir(parents=True, exist_ok=True)
@@ -490,11 +467,12 @@ def browse_data():
     try:
         # Get all records and clean NaN values
         if hasattr(loaded_data, 'to_dict'):
-            all_records = loaded_data.fillna('').to_dict('records')
             # Keep only important columns and filter empty values
             important_cols = ['crash_date', 'borough', 'on_street_name', 'cross_street_name',
                             'number_of_persons_injured', 'number_of_persons_killed', 
                             'vehicle_type_code1', 'vehicle_type_code2']
+            present_cols = [c for c in important_cols if c in loaded_data.columns]
+            all_records = loaded_data[present_cols].astype(object).fillna('').to_dict('records')
             
             cleaned_records = []
             for record in all_records:
@@ -526,9 +504,7 @@ def export_csv():
         data_dir.mkdir(parents=True, exist_ok=True)
         output_path = data_dir / "web_export.csv"
         
-        cd.write_csv_header(output_path)
-        rows = loaded_data.to_dict(orient="records") if hasattr(loaded_data, "to_dict") else loaded_data
-        cd.append_rows_to_csv(output_path, rows)
+        cd.write_rows_to_csv(output_path, loaded_data)
         
         return send_file(str(output_path), as_attachment=True, download_name="nyc_crashes_export.csv")
     except Exception as e: